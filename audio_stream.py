@@ -0,0 +1,146 @@
+"""
+Audio re-framing helpers for the ElevenLabs Streaming TTS examples.
+
+Provides AudioByteStream, a progressive output buffer that turns an
+incoming stream of arbitrarily sized audio chunks into frames that start
+small (20 ms) for fast time-to-first-audio and double in size up to a
+target (200 ms) for efficient steady-state forwarding.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# ulaw_8000 is 1 byte per sample at 8 kHz -> 8 bytes per millisecond
+ULAW_8000_BYTES_PER_MS = 8
+
+
+def _build_ulaw_table():
+    """256-entry G.711 u-law -> 16-bit little-endian PCM lookup table."""
+    table = []
+    for i in range(256):
+        u = ~i & 0xFF
+        magnitude = (((u & 0x0F) << 3) + 0x84) << ((u & 0x70) >> 4)
+        sample = (0x84 - magnitude) if (u & 0x80) else (magnitude - 0x84)
+        table.append(sample.to_bytes(2, 'little', signed=True))
+    return table
+
+
+_ULAW_TO_PCM16 = _build_ulaw_table()
+
+
+def ulaw_to_pcm16(data: bytes) -> bytes:
+    """Decode u-law bytes to 16-bit little-endian PCM via table lookup."""
+    return b''.join(map(_ULAW_TO_PCM16.__getitem__, data))
+
+
+class AudioByteStream:
+    """Progressive re-framing buffer for streaming audio.
+
+    Accumulates incoming bytes and emits frames whose duration starts at
+    min_frame_ms and doubles on each emit until capped at max_frame_ms.
+    A small tail (tail_ms) is always held back so the final frame can be
+    marked is_final on flush. Frames are yielded as (bytes, is_final)
+    tuples.
+    """
+
+    def __init__(
+        self,
+        bytes_per_ms: int = ULAW_8000_BYTES_PER_MS,
+        progressive: bool = True,
+        min_frame_ms: int = 20,
+        max_frame_ms: int = 200,
+        tail_ms: int = 10,
+    ):
+        self.bytes_per_ms = bytes_per_ms
+        self.progressive = progressive
+        self.min_frame_bytes = bytes_per_ms * min_frame_ms
+        self.max_frame_bytes = bytes_per_ms * max_frame_ms
+        self.tail_bytes = bytes_per_ms * tail_ms
+        self._buf = bytearray()
+        self._target = self.min_frame_bytes if progressive else self.max_frame_bytes
+
+    def push(self, chunk: bytes):
+        """Add incoming bytes and yield any frames ready to forward."""
+        self._buf.extend(chunk)
+
+        # Keep the tail in reserve so flush() always has a final frame
+        while len(self._buf) - self.tail_bytes >= self._target:
+            frame = bytes(self._buf[:self._target])
+            del self._buf[:self._target]
+            if self.progressive and self._target < self.max_frame_bytes:
+                self._target = min(self._target * 2, self.max_frame_bytes)
+            yield frame, False
+
+    def flush(self):
+        """Emit any buffered bytes as a final frame (is_final=True)."""
+        if self._buf:
+            frame = bytes(self._buf)
+            self._buf.clear()
+            yield frame, True
+
+    def reset(self):
+        """Drop buffered audio and restart at the small first frame.
+
+        Call on interruption (e.g. barge-in) so the next utterance gets
+        the same fast time-to-first-audio as the first.
+        """
+        self._buf.clear()
+        self._target = self.min_frame_bytes if self.progressive else self.max_frame_bytes
+
+
+class AudioSink:
+    """Appending audio sink: hand chunks over as they arrive.
+
+    Mirrors the MediaSource/SourceBuffer pattern: each chunk is appended
+    to the output the moment it arrives instead of being accumulated
+    blob-style until the stream completes. With local playback enabled
+    (and sounddevice installed) chunks go straight to the audio device;
+    otherwise they are teed into a bytearray for downstream use.
+    """
+
+    def __init__(self, samplerate: int = 8000, local_playback: bool = False,
+                 audio_format: str = 'ulaw_8000'):
+        self.bytes_received = 0
+        self._buffer = bytearray()
+        self._stream = None
+        # RawOutputStream expects 16-bit linear PCM; ulaw chunks are
+        # decoded on append, other compressed formats can't be played here
+        self._decode_ulaw = 'ulaw' in audio_format
+        if local_playback:
+            if not (self._decode_ulaw or 'pcm' in audio_format):
+                logger.warning(f"Format {audio_format} not playable by AudioSink, buffering instead")
+                return
+            try:
+                import sounddevice as sd
+                self._stream = sd.RawOutputStream(
+                    samplerate=samplerate, channels=1, dtype='int16'
+                )
+                self._stream.start()
+            except Exception as e:
+                logger.warning(f"Local playback unavailable, buffering instead: {e}")
+
+    def append(self, chunk: bytes):
+        """Append one chunk to the output (plays immediately if local)."""
+        self.bytes_received += len(chunk)
+        if self._stream is not None:
+            if self._decode_ulaw:
+                chunk = ulaw_to_pcm16(chunk)
+            self._stream.write(chunk)
+        else:
+            self._buffer.extend(chunk)
+
+    def end_of_stream(self):
+        """Signal that no more chunks are coming; finish playback cleanly."""
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+    def abort(self):
+        """Stop immediately mid-stream (Ctrl-C, barge-in) and drop audio."""
+        if self._stream is not None:
+            self._stream.abort()
+            self._stream.close()
+            self._stream = None
+        self._buffer.clear()
@@ -11,26 +11,119 @@ import logging
 import os
 from typing import AsyncGenerator
 
+from audio_stream import AudioByteStream, AudioSink
+
+# Resolve the MindRoot service once at import time rather than inside the
+# examples - the first in-function import would pull in the whole provider
+# graph while holding the import lock on the event-loop thread.
+try:
+    from lib.providers.services import get_service
+    stream_tts = get_service('stream_tts')
+except ImportError:
+    stream_tts = None
+
 # Configure logging to see streaming details
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parse the local-playback switch once at import instead of per example
+_TRUTHY = frozenset({'1', 'true', 'yes', 'on'})
+LOCAL_PLAYBACK = os.getenv('MR_TTS_PLAY_LOCAL', '').lower() in _TRUTHY
+
+# Jitter buffer: accumulate this much audio before playback starts.
+# Typical VoIP jitter buffers sit in the 40-80 ms range; trade latency
+# for glitch-free steady state by raising MR_TTS_PREROLL_MS.
+PREROLL_MS = int(os.getenv('MR_TTS_PREROLL_MS', '60'))
+PREROLL_BYTES = PREROLL_MS * 8  # ulaw_8000 is 8 bytes per millisecond
+FRAME_BYTES = 160  # 20 ms ulaw frame
+
 # Mock SIP session for demonstration
 class MockSipSession:
     """Mock SIP session for demonstration purposes."""
-    
+
     def __init__(self, session_id: str):
         self.session_id = session_id
         self.audio_chunks_received = 0
-    
+        self._preroll = bytearray()
+        self._playing = False
+        self._drain_task = None
+
     async def send_audio(self, audio_chunk: bytes):
-        """Simulate sending audio to SIP phone."""
+        """Simulate sending audio to SIP phone.
+
+        Buffers a short pre-roll before the first byte is "played" so
+        network jitter doesn't cause underruns once playback starts.
+        """
+        if not self._playing:
+            self._preroll.extend(audio_chunk)
+            if len(self._preroll) >= PREROLL_BYTES:
+                self._playing = True
+                self._drain_task = asyncio.create_task(self._drain_preroll())
+            return
+
+        # Let the pre-roll finish draining so frames stay in order
+        if self._drain_task is not None:
+            await self._drain_task
+            self._drain_task = None
+
+        await self._forward(audio_chunk)
+
+    async def _forward(self, audio_chunk: bytes):
+        """Actually send one chunk, simulating network delay."""
         self.audio_chunks_received += 1
         logger.info(f"SIP {self.session_id}: Sent audio chunk {self.audio_chunks_received} ({len(audio_chunk)} bytes)")
-        
+
         # Simulate network delay
         await asyncio.sleep(0.01)
-    
+
+    async def send_audio_many(self, chunks):
+        """Send a batch of chunks with a single aggregate network delay.
+
+        b''.join + one sleep replaces N per-chunk event-loop round-trips.
+        """
+        if not chunks:
+            return
+
+        if not self._playing:
+            # Route through the jitter buffer until playback has started
+            for chunk in chunks:
+                await self.send_audio(chunk)
+            return
+
+        # Let the pre-roll finish draining so frames stay in order
+        if self._drain_task is not None:
+            await self._drain_task
+            self._drain_task = None
+
+        payload = b"".join(chunks)
+        self.audio_chunks_received += len(chunks)
+        logger.info(f"SIP {self.session_id}: Sent batch of {len(chunks)} audio chunks ({len(payload)} bytes)")
+
+        # Simulate network delay for the whole batch at once
+        await asyncio.sleep(0.01 * len(chunks))
+
+    async def _drain_preroll(self):
+        """Drain the buffered pre-roll one frame at a time."""
+        while self._preroll:
+            frame = bytes(self._preroll[:FRAME_BYTES])
+            del self._preroll[:FRAME_BYTES]
+            await self._forward(frame)
+
+    async def flush(self):
+        """Drain any buffered audio at end of stream.
+
+        An utterance shorter than the pre-roll threshold never trips the
+        drain in send_audio, so the caller signals end-of-stream here to
+        start it regardless of how much is buffered.
+        """
+        if not self._playing and self._preroll:
+            self._playing = True
+            self._drain_task = asyncio.create_task(self._drain_preroll())
+        if self._drain_task is not None:
+            await self._drain_task
+            self._drain_task = None
+
+
     async def listen_for_response(self):
         """Simulate listening for user response."""
         logger.info(f"SIP {self.session_id}: Listening for user response...")
@@ -41,38 +134,56 @@ async def basic_tts_example():
     """Basic example of streaming TTS."""
     print("\n=== Basic TTS Streaming Example ===")
     
+    if stream_tts is None:
+        print("Note: This example requires the MindRoot framework to run.")
+        print("The service would be available as: get_service('stream_tts')")
+        return
+
     try:
-        # Import the service (this would be available in MindRoot)
-        from lib.providers.services import get_service
-        stream_tts = get_service('stream_tts')
-        
         text = "Hello! Welcome to our automated phone system. How can I assist you today?"
         
         chunk_count = 0
         total_bytes = 0
-        
-        async for audio_chunk in stream_tts(text):
-            chunk_count += 1
-            total_bytes += len(audio_chunk)
-            print(f"Received chunk {chunk_count}: {len(audio_chunk)} bytes")
-            
-            # In a real scenario, you'd send this to your audio system
-            # await audio_system.play(audio_chunk)
-        
-        print(f"Streaming complete! Total: {chunk_count} chunks, {total_bytes} bytes")
-        
-    except ImportError:
-        print("Note: This example requires the MindRoot framework to run.")
-        print("The service would be available as: get_service('stream_tts')")
+
+        # Progressive re-framing: small first frame for fast time-to-first-audio,
+        # then doubling frame sizes for efficient steady-state forwarding
+        frames = AudioByteStream(progressive=True)
+
+        # Append each frame to the sink as it arrives (MediaSource-style)
+        # rather than accumulating the whole response before playing
+        sink = AudioSink(local_playback=LOCAL_PLAYBACK)
+
+        try:
+            async for audio_chunk in stream_tts(text):
+                for frame, is_final in frames.push(audio_chunk):
+                    chunk_count += 1
+                    total_bytes += len(frame)
+                    sink.append(frame)
+                    print(f"Forwarded frame {chunk_count}: {len(frame)} bytes")
+
+            for frame, is_final in frames.flush():
+                chunk_count += 1
+                total_bytes += len(frame)
+                sink.append(frame)
+                print(f"Forwarded final frame {chunk_count}: {len(frame)} bytes")
+
+            sink.end_of_stream()
+        except BaseException:
+            # Ctrl-C or a streaming error mid-utterance: stop cleanly
+            sink.abort()
+            raise
+
+        print(f"Streaming complete! Total: {chunk_count} frames, {total_bytes} bytes")
+
+    except Exception as e:
+        print(f"Error: {e}")
 
 async def local_playback_example():
     """Example demonstrating local playback feature."""
     print("\n=== Local Playback Example ===")
     
     # Check if local playback is enabled
-    local_playback = os.getenv('MR_TTS_PLAY_LOCAL', '').lower() in ('1', 'true', 'yes', 'on')
-    
-    if local_playback:
+    if LOCAL_PLAYBACK:
         print("✓ Local playback is ENABLED (MR_TTS_PLAY_LOCAL=true)")
         print("Audio will be played locally AND streamed to backend systems")
     else:
@@ -89,18 +200,18 @@ async def local_playback_example():
         
         print(f"\nStreaming text: '{text}'")
         
-        if local_playback:
+        if LOCAL_PLAYBACK:
             print("🔊 You should hear audio playing locally...")
         
         # Simulate streaming
         for i in range(8):  # Simulate 8 audio chunks
             fake_chunk = b'\x00' * 160  # Simulate 160 bytes of audio
-            print(f"Chunk {i+1}: {len(fake_chunk)} bytes")
+            print(f"[local] Chunk {i+1}: {len(fake_chunk)} bytes")
             await asyncio.sleep(0.1)  # Simulate streaming delay
         
         print("Streaming complete!")
         
-        if local_playback:
+        if LOCAL_PLAYBACK:
             print("🎵 Local playback should have finished")
         
     except Exception as e:
@@ -127,16 +238,31 @@ async def sip_phone_example():
         
         for message in messages:
             print(f"\nStreaming: '{message}'")
-            
+
             # In real usage:
             # async for audio_chunk in stream_tts(message):
-            #     await sip_session.send_audio(audio_chunk)
-            
-            # Simulate streaming chunks
+            #     for frame, is_final in frames.push(audio_chunk):
+            #         await sip_session.send_audio(frame)
+
+            # Progressive frames: 20 ms first, doubling up to 200 ms
+            frames = AudioByteStream(progressive=True)
+
+            # Simulate streaming chunks, batching the whole message into
+            # one send_audio_many call instead of a send per frame
+            batch = []
             for i in range(5):  # Simulate 5 audio chunks per message
                 fake_chunk = b'\x00' * 160  # Simulate 160 bytes of ulaw audio
-                await sip_session.send_audio(fake_chunk)
-        
+                for frame, is_final in frames.push(fake_chunk):
+                    batch.append(frame)
+
+            for frame, is_final in frames.flush():
+                batch.append(frame)
+
+            await sip_session.send_audio_many(batch)
+
+        # End of stream: play out anything still below the pre-roll threshold
+        await sip_session.flush()
+
         # Listen for user response
         user_response = await sip_session.listen_for_response()
         print(f"User response: {user_response}")
@@ -165,8 +291,7 @@ async def custom_voice_example():
         print(f"async for chunk in stream_tts(**custom_config):")
         print("    await process_audio_chunk(chunk)")
         
-        local_playback = os.getenv('MR_TTS_PLAY_LOCAL', '').lower() in ('1', 'true', 'yes', 'on')
-        if local_playback:
+        if LOCAL_PLAYBACK:
             print("\n🔊 With local playback enabled, you would hear:")
             print("- High-quality audio using Adam's voice")
             print("- Audio played locally AND streamed to backend")
@@ -194,8 +319,7 @@ async def speak_command_example():
             # Simulate command execution
             print("Response: Speech streaming completed: 45 characters, 12 audio chunks")
             
-            local_playback = os.getenv('MR_TTS_PLAY_LOCAL', '').lower() in ('1', 'true', 'yes', 'on')
-            if local_playback:
+            if LOCAL_PLAYBACK:
                 print("          (also played locally)")
         
         print("\nThe speak command:")
@@ -244,40 +368,54 @@ async def performance_monitoring_example():
     """Example of monitoring streaming performance."""
     print("\n=== Performance Monitoring Example ===")
     
-    import time
-    
+    # perf_counter_ns is monotonic: wall-clock time.time() can jump on
+    # NTP adjustment, which invalidates latency measurements
+    from time import perf_counter_ns
+
     try:
-        start_time = time.time()
+        start_ns = perf_counter_ns()
         chunk_count = 0
         total_bytes = 0
-        first_chunk_time = None
+        first_chunk_ns = None
         
         text = "This is a performance test message to measure streaming latency and throughput."
         
         print(f"Starting TTS for: '{text}'")
         
-        local_playback = os.getenv('MR_TTS_PLAY_LOCAL', '').lower() in ('1', 'true', 'yes', 'on')
-        if local_playback:
+        if LOCAL_PLAYBACK:
             print("🔊 Local playback enabled - audio will play during streaming")
         
         # In real usage:
         # async for audio_chunk in stream_tts(text):
         
+        # Pre-size the accumulator and write by offset instead of
+        # `bytes += chunk`, which reallocates the whole buffer per chunk
+        CHUNKS_HINT = 10
+        buf = bytearray(CHUNKS_HINT * 160)
+        off = 0
+
         # Simulate streaming performance
         for i in range(10):  # Simulate 10 chunks
-            if first_chunk_time is None:
-                first_chunk_time = time.time()
-                print(f"Time to first chunk: {first_chunk_time - start_time:.3f}s")
-            
+            if first_chunk_ns is None:
+                first_chunk_ns = perf_counter_ns()
+                print(f"Time to first chunk: {(first_chunk_ns - start_ns) / 1e6:.3f} ms")
+
+            chunk = b'\x00' * 160  # Typical ulaw chunk size
+            if off + len(chunk) > len(buf):
+                buf.extend(b'\x00' * len(buf))  # double capacity, amortized O(1)
+            buf[off:off + len(chunk)] = chunk
+            off += len(chunk)
             chunk_count += 1
-            chunk_size = 160  # Typical ulaw chunk size
-            total_bytes += chunk_size
-            
-            print(f"Chunk {chunk_count}: {chunk_size} bytes")
+
+            print(f"[perf] Chunk {chunk_count}: {len(chunk)} bytes")
             await asyncio.sleep(0.02)  # Simulate processing time
-        
-        end_time = time.time()
-        total_time = end_time - start_time
+
+        # Zero-copy view of the captured audio for downstream writers
+        audio = memoryview(buf)[:off]
+        total_bytes = len(audio)
+
+        end_ns = perf_counter_ns()
+        total_time = (end_ns - start_ns) / 1e9
         
         print(f"\nPerformance Summary:")
         print(f"Total time: {total_time:.3f}s")
@@ -286,7 +424,7 @@ async def performance_monitoring_example():
         print(f"Average chunk rate: {chunk_count / total_time:.1f} chunks/sec")
         print(f"Average throughput: {total_bytes / total_time:.1f} bytes/sec")
         
-        if local_playback:
+        if LOCAL_PLAYBACK:
             print(f"Local playback: Enabled (adds minimal overhead)")
         
     except Exception as e:
@@ -298,11 +436,9 @@ async def environment_setup_example():
     
     # Check current environment
     api_key = os.getenv('ELEVENLABS_API_KEY')
-    local_playback = os.getenv('MR_TTS_PLAY_LOCAL', '').lower() in ('1', 'true', 'yes', 'on')
-    
     print("Current Environment:")
     print(f"ELEVENLABS_API_KEY: {'✓ Set' if api_key else '✗ Not set'}")
-    print(f"MR_TTS_PLAY_LOCAL: {'✓ Enabled' if local_playback else '✗ Disabled'}")
+    print(f"MR_TTS_PLAY_LOCAL: {'✓ Enabled' if LOCAL_PLAYBACK else '✗ Disabled'}")
     
     print("\nTo set up the environment:")
     print("")
@@ -319,7 +455,7 @@ async def environment_setup_example():
     if not api_key:
         print("⚠️  Warning: ELEVENLABS_API_KEY not set - plugin will not work")
     
-    if not local_playback:
+    if not LOCAL_PLAYBACK:
         print("ℹ️  Info: Local playback disabled - audio will only stream to backend")
         print("   To test locally: export MR_TTS_PLAY_LOCAL=true")
 
@@ -328,14 +464,22 @@ async def main():
     print("ElevenLabs Streaming TTS Plugin - Usage Examples")
     print("=" * 60)
     
+    # Print-only examples run sequentially so their output stays readable
     await environment_setup_example()
     await basic_tts_example()
-    await local_playback_example()
     await speak_command_example()
-    await sip_phone_example()
     await custom_voice_example()
     await error_handling_example()
-    await performance_monitoring_example()
+
+    # The sleep-bound examples are independent; run them concurrently so
+    # the demo finishes in the length of the longest, not the sum.
+    # (Their output interleaves - each line is labeled by its example.)
+    print("\n--- Running remaining examples concurrently ---")
+    await asyncio.gather(
+        local_playback_example(),
+        sip_phone_example(),
+        performance_monitoring_example(),
+    )
     
     print("\n=== Installation Instructions ===")
     print("1. Set your ElevenLabs API key:")
@@ -353,4 +497,11 @@ async def main():
     print('   {"speak": {"text": "Hello world"}}')
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        # uvloop's libuv-backed loop is a drop-in replacement that is
+        # significantly faster for I/O-bound async workloads like this one.
+        import uvloop
+        uvloop.run(main())
+    except ImportError:
+        # uvloop is POSIX-only; fall back to the stdlib loop (e.g. on Windows)
+        asyncio.run(main())
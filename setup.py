@@ -8,13 +8,15 @@ setup(
     package_dir={"": "src"},
     install_requires=[
         "elevenlabs>=1.0.0",
-        "dotenv"
+        "python-dotenv",
+        "orjson",
+        'uvloop>=0.19; sys_platform != "win32"',
     ],
     extras_require={
         "playback": [
-            "pygame>=2.0.0",
-            "pydub>=0.25.0",
-            "simpleaudio>=1.0.0",
+            "sounddevice>=0.4",
+            "soundfile>=0.12",
+            "numpy",
         ],
         "dev": [
             "pytest",
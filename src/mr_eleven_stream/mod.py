@@ -1,7 +1,14 @@
 import os
 import asyncio
+import atexit
+import concurrent.futures
 import io
+import queue
+import shutil
 import subprocess
+import threading
+import time
+from contextlib import suppress
 from typing import AsyncGenerator, Optional, Dict, Any
 from elevenlabs.client import ElevenLabs
 from lib.providers.services import service, service_manager
@@ -19,155 +26,421 @@ logger = logging.getLogger(__name__)
 DEFAULT_VOICE_ID = "JBFqnCBsd6RMkjVDRZzb"  # George voice
 DEFAULT_MODEL_ID = "eleven_flash_v2_5"  # Ultra-low latency for real-time
 DEFAULT_OUTPUT_FORMAT = "ulaw_8000"  # Standard for SIP/telephony
-SIMILARITY_BOOST_DEFAULT = os.environ.get('ELEVENLABS_SIMILARITY_BOOST_DEFAULT', 0.75)
-SPEECH_SPEED_DEFAULT = os.environ.get('ELEVENLABS_SPEECH_SPEED_DEFAULT', 1.0)
-STABILITY_DEFAULT = os.environ.get('ELEVENLABS_STABILITY_DEFAULT', 0.5)
+# os.environ values are strings; parse to float once here so the API
+# always receives numbers rather than coercing per request
+SIMILARITY_BOOST_DEFAULT = float(os.environ.get('ELEVENLABS_SIMILARITY_BOOST_DEFAULT', 0.75))
+SPEECH_SPEED_DEFAULT = float(os.environ.get('ELEVENLABS_SPEECH_SPEED_DEFAULT', 1.0))
+STABILITY_DEFAULT = float(os.environ.get('ELEVENLABS_STABILITY_DEFAULT', 0.5))
+
+# SIP/RTP framing: 160 bytes is one 20 ms frame of ulaw_8000
+RTP_FRAME_BYTES = 160
+
+# Wire bytes per second of audio for each output format, for converting
+# sent bytes into seconds when pacing
+_BYTES_PER_SEC = {
+    "ulaw_8000": 8000,
+    "pcm_16000": 32000,
+    "pcm_22050": 44100,
+    "pcm_24000": 48000,
+    "pcm_44100": 88200,
+    "mp3_22050_32": 4000,
+}
 
 # Global dictionary to track active speak() calls per log_id
 _active_speak_locks: Dict[str, asyncio.Lock] = {}
 
+# Persona voice_id per agent_name, cached with a short TTL so steady-state
+# calls don't pay a service round-trip per utterance
+_VOICE_CACHE: Dict[str, tuple] = {}
+_VOICE_CACHE_TTL = 60.0
 
-# Local playback support
-def _get_local_playback_enabled() -> bool:
-    """Check if local playback is enabled via environment variable."""
-    return service_manager.functions.get('sip_audio_out_chunk', None) is None
-    #return os.getenv('MR_TTS_PLAY_LOCAL', '').lower() in ('1', 'true', 'yes', 'on')
 
-def _play_audio_locally(audio_data: bytes, output_format: str) -> None:
-    """Play audio data locally using available audio libraries."""
+async def _resolve_voice(agent_name: str, default: str) -> str:
+    """Resolve an agent's persona voice_id, cached for _VOICE_CACHE_TTL seconds."""
+    cached = _VOICE_CACHE.get(agent_name)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _VOICE_CACHE_TTL:
+        return cached[1]
+
     try:
-        # Try to use elevenlabs.play first (if available)
+        agent_data = await service_manager.get_agent_data(agent_name)
+        persona = agent_data["persona"]
+    except Exception as e:
+        logger.warning(f"Could not get agent persona voice_id, using default. Error: {str(e)}")
+        return default
+
+    # Only cache a voice the persona actually defines; caching the
+    # caller-supplied fallback would leak it to later callers with a
+    # different default
+    if "voice_id" not in persona:
+        return default
+
+    voiceid = persona["voice_id"]
+    _VOICE_CACHE[agent_name] = (now, voiceid)
+    return voiceid
+
+
+def refresh_voice(agent_name: str) -> None:
+    """Drop the cached voice for an agent (call after a persona edit)."""
+    _VOICE_CACHE.pop(agent_name, None)
+
+
+# Long-lived ffplay processes, one per output format, so playback does not
+# pay fork+exec and codec init on every utterance
+_FFPLAY_PROCS: Dict[str, subprocess.Popen] = {}
+
+
+# ffplay argv precomputed per ElevenLabs output format - no per-call string
+# scanning or list building
+_FFPLAY_BASE = ['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet']
+_FFPLAY_ARGV = {
+    'ulaw_8000': _FFPLAY_BASE + ['-f', 'mulaw', '-ar', '8000', '-ac', '1', '-i', 'pipe:0'],
+    'mp3_22050_32': _FFPLAY_BASE + ['-f', 'mp3', '-i', 'pipe:0'],
+    'mp3_44100_128': _FFPLAY_BASE + ['-f', 'mp3', '-i', 'pipe:0'],
+    'pcm_16000': _FFPLAY_BASE + ['-f', 's16le', '-ar', '16000', '-ac', '1', '-i', 'pipe:0'],
+    'pcm_22050': _FFPLAY_BASE + ['-f', 's16le', '-ar', '22050', '-ac', '1', '-i', 'pipe:0'],
+    'pcm_24000': _FFPLAY_BASE + ['-f', 's16le', '-ar', '24000', '-ac', '1', '-i', 'pipe:0'],
+    'pcm_44100': _FFPLAY_BASE + ['-f', 's16le', '-ar', '44100', '-ac', '1', '-i', 'pipe:0'],
+}
+# ffplay probes the container/codec itself for formats not in the table
+_FFPLAY_ARGV_GENERIC = _FFPLAY_BASE + ['-i', 'pipe:0']
+
+
+def _ffplay_cmd(output_format: str) -> list:
+    """Look up the ffplay argv for an ElevenLabs output format."""
+    return _FFPLAY_ARGV.get(output_format) or _FFPLAY_ARGV_GENERIC
+
+
+async def _get_ffplay_proc(output_format: str):
+    """Get (or spawn) the persistent ffplay process for a format.
+
+    Spawned with asyncio.create_subprocess_exec so chunk writes can use
+    StreamWriter.drain() for backpressure instead of tying up an
+    executor thread on a blocking pipe write.
+    """
+    proc = _FFPLAY_PROCS.get(output_format)
+    if proc is not None and proc.returncode is None:
+        return proc
+
+    proc = await asyncio.create_subprocess_exec(
+        *_ffplay_cmd(output_format),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+    _FFPLAY_PROCS[output_format] = proc
+    logger.debug(f"Spawned persistent ffplay for format {output_format}")
+    return proc
+
+
+def _close_ffplay_procs() -> None:
+    """Close all persistent ffplay processes on shutdown (best effort)."""
+    for proc in _FFPLAY_PROCS.values():
         try:
-            from elevenlabs.play import play
-            logger.debug("Trying to play audio locally.")
-            play(audio_data)
-            logger.debug("Played audio using elevenlabs.play")
-            return
-        except ImportError:
+            if proc.returncode is None:
+                proc.stdin.close()
+                proc.terminate()
+        except Exception:
             pass
- 
-        # Try ffplay first for direct streaming (most efficient)
+    _FFPLAY_PROCS.clear()
+
+
+atexit.register(_close_ffplay_procs)
+
+
+# pygame mixer is initialized once and kept alive; re-initializing per
+# utterance costs tens of milliseconds
+_PYGAME_READY = False
+
+
+def _ensure_pygame():
+    """Import pygame and initialize the mixer once."""
+    global _PYGAME_READY
+    import pygame
+    if not _PYGAME_READY:
+        pygame.mixer.init(frequency=22050, channels=1)
+        _PYGAME_READY = True
+    return pygame
+
+
+# pydub decoding launches ffmpeg under the hood; run it on a dedicated
+# worker thread so it never serializes with network streaming
+_PYDUB_QUEUE = None
+_PLAYBACK_THREAD = None
+
+
+def _pydub_play(audio_data: bytes, output_format: str) -> None:
+    """Decode with pydub and play one utterance (runs on the worker thread)."""
+    from pydub import AudioSegment
+    from pydub.playback import play as pydub_play
+
+    # Determine audio format for pydub
+    if 'mp3' in output_format.lower():
+        audio = AudioSegment.from_mp3(io.BytesIO(audio_data))
+    elif 'pcm' in output_format.lower():
+        # Assume 16-bit PCM
+        sample_rate = 22050  # Default
+        if '16000' in output_format:
+            sample_rate = 16000
+        elif '44100' in output_format:
+            sample_rate = 44100
+        elif '24000' in output_format:
+            sample_rate = 24000
+
+        audio = AudioSegment(
+            audio_data,
+            frame_rate=sample_rate,
+            sample_width=2,  # 16-bit
+            channels=1  # Mono
+        )
+    else:
+        # For other formats (including ulaw), try to convert
+        logger.warning(f"Unsupported format for local playback: {output_format}")
+        return
+
+    pydub_play(audio)
+    logger.debug("Played audio using pydub")
+
+
+def _pydub_worker() -> None:
+    """Drain the playback queue, one (bytes, format) utterance at a time."""
+    while True:
+        audio_data, output_format = _PYDUB_QUEUE.get()
         try:
-            logger.debug("Trying to play audio directly with ffplay")
-            
-            # Determine ffplay parameters based on format
-            if 'ulaw' in output_format.lower():
-                # For ulaw, specify format and audio parameters
-                cmd = [
-                    'ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet',
-                    '-f', 'mulaw', '-ar', '8000', '-ac', '1', '-i', 'pipe:0'
-                ]
-            elif 'mp3' in output_format.lower():
-                cmd = [
-                    'ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet',
-                    '-f', 'mp3', '-i', 'pipe:0'
-                ]
-            elif 'pcm' in output_format.lower():
-                # Determine sample rate from format
-                sample_rate = 22050
-                if '16000' in output_format:
-                    sample_rate = 16000
-                elif '44100' in output_format:
-                    sample_rate = 44100
-                elif '24000' in output_format:
-                    sample_rate = 24000
-                
-                cmd = [
-                    'ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet',
-                    '-f', 's16le', '-ar', str(sample_rate), '-ac', '1', '-i', 'pipe:0'
-                ]
-            else:
-                # Try generic format
-                cmd = [
-                    'ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet',
-                    '-i', 'pipe:0'
-                ]
-            
-            # Pipe audio data directly to ffplay
-            process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
-            process.communicate(input=audio_data)
-            
-            if process.returncode == 0:
-                logger.debug("Played audio using ffplay")
-                return
-            else:
-                logger.warning(f"ffplay failed with return code {process.returncode}")
-        except FileNotFoundError:
-            logger.debug("ffplay not available")
+            _pydub_play(audio_data, output_format)
         except Exception as e:
-            logger.warning(f"ffplay error: {str(e)}")
-        
-       
-        # Fallback to pygame if available
-        try:
-            import pygame
-            pygame.mixer.init()
-            logger.debug("Trying to play locally with pygame") 
-            # Convert audio data to a format pygame can handle
-            audio_io = io.BytesIO(audio_data)
-            pygame.mixer.music.load(audio_io)
-            pygame.mixer.music.play()
-            
-            # Wait for playback to complete
-            while pygame.mixer.music.get_busy():
-                pygame.time.wait(100)
-            
-            logger.debug("Played audio using pygame")
-            return
-        except ImportError:
-            pass
-        
-        # Fallback to pydub + simpleaudio if available
-        try:
-            from pydub import AudioSegment
-            from pydub.playback import play as pydub_play
-            
-            # Determine audio format for pydub
-            if 'mp3' in output_format.lower():
-                audio = AudioSegment.from_mp3(io.BytesIO(audio_data))
-            elif 'pcm' in output_format.lower():
-                # Assume 16-bit PCM
-                sample_rate = 22050  # Default
-                if '16000' in output_format:
-                    sample_rate = 16000
-                elif '44100' in output_format:
-                    sample_rate = 44100
-                elif '24000' in output_format:
-                    sample_rate = 24000
-                
-                audio = AudioSegment(
-                    audio_data,
-                    frame_rate=sample_rate,
-                    sample_width=2,  # 16-bit
-                    channels=1  # Mono
-                )
-            else:
-                # For other formats (including ulaw), try to convert
-                logger.warning(f"Unsupported format for local playback: {output_format}")
-                return
-            
-            pydub_play(audio)
-            logger.debug("Played audio using pydub")
-            return
-        except ImportError:
-            pass
-        
-        logger.warning("No audio playback library available. Install ffplay, elevenlabs[play], pygame, or pydub+simpleaudio for local playback.")
-        
+            logger.error(f"Error in pydub playback: {str(e)}")
+        finally:
+            _PYDUB_QUEUE.task_done()
+
+
+def _enqueue_pydub(audio_data: bytes, output_format: str) -> None:
+    """Queue an utterance for the persistent pydub playback thread."""
+    global _PYDUB_QUEUE, _PLAYBACK_THREAD
+    if _PLAYBACK_THREAD is None:
+        _PYDUB_QUEUE = queue.Queue()
+        _PLAYBACK_THREAD = threading.Thread(
+            target=_pydub_worker, name="pydub-playback", daemon=True
+        )
+        _PLAYBACK_THREAD.start()
+    _PYDUB_QUEUE.put((audio_data, output_format))
+
+
+def _play_elevenlabs(audio_data: bytes, output_format: str) -> None:
+    from elevenlabs.play import play
+    play(audio_data)
+    logger.debug("Played audio using elevenlabs.play")
+
+
+def _play_ffplay(audio_data: bytes, output_format: str) -> None:
+    # Pipe audio data directly to ffplay
+    process = subprocess.Popen(_ffplay_cmd(output_format), stdin=subprocess.PIPE)
+    process.communicate(input=audio_data)
+
+    if process.returncode == 0:
+        logger.debug("Played audio using ffplay")
+    else:
+        logger.warning(f"ffplay failed with return code {process.returncode}")
+
+
+def _play_pygame(audio_data: bytes, output_format: str) -> None:
+    pygame = _ensure_pygame()
+    # Convert audio data to a format pygame can handle
+    audio_io = io.BytesIO(audio_data)
+    pygame.mixer.music.load(audio_io)
+    pygame.mixer.music.play()
+
+    # Wait for playback to complete
+    while pygame.mixer.music.get_busy():
+        pygame.time.wait(100)
+
+    logger.debug("Played audio using pygame")
+
+
+def _build_ulaw_table():
+    """256-entry G.711 u-law -> 16-bit little-endian PCM lookup table."""
+    table = []
+    for i in range(256):
+        u = ~i & 0xFF
+        magnitude = (((u & 0x0F) << 3) + 0x84) << ((u & 0x70) >> 4)
+        sample = (0x84 - magnitude) if (u & 0x80) else (magnitude - 0x84)
+        table.append(sample.to_bytes(2, 'little', signed=True))
+    return table
+
+
+_ULAW_TO_PCM16 = _build_ulaw_table()
+
+
+def _play_sounddevice(audio_data: bytes, output_format: str) -> None:
+    # RawOutputStream takes 16-bit linear PCM, so ulaw is decoded via
+    # table lookup and pcm_* passes straight through; compressed formats
+    # (mp3) have no decoder here
+    import sounddevice as sd
+
+    if 'ulaw' in output_format:
+        audio_data = b''.join(map(_ULAW_TO_PCM16.__getitem__, audio_data))
+        samplerate = 8000
+    elif output_format.startswith('pcm_'):
+        samplerate = int(output_format.split('_')[1])
+    else:
+        logger.warning(f"Format {output_format} not playable via sounddevice")
+        return
+
+    with sd.RawOutputStream(samplerate=samplerate, channels=1, dtype='int16') as stream:
+        stream.write(audio_data)
+    logger.debug("Played audio using sounddevice")
+
+
+def _resolve_playback_backend():
+    """Pick the local playback backend once at import time.
+
+    Resolving up front means _play_audio_locally is a single dispatch
+    instead of re-running an ImportError ladder on every utterance.
+    """
+    # elevenlabs is a hard dependency so its import always succeeds, but
+    # elevenlabs.play shells out to ffplay and raises at runtime without
+    # it - both rungs depend on the binary being present
+    if shutil.which('ffplay'):
+        with suppress(ImportError):
+            from elevenlabs.play import play  # noqa: F401 - availability check
+            return 'elevenlabs', _play_elevenlabs
+
+        return 'ffplay', _play_ffplay
+
+    # The playback extra (pip install -e ".[playback]") provides this one
+    with suppress(ImportError):
+        import sounddevice  # noqa: F401
+        return 'sounddevice', _play_sounddevice
+
+    with suppress(ImportError):
+        import pygame  # noqa: F401
+        return 'pygame', _play_pygame
+
+    with suppress(ImportError):
+        from pydub import AudioSegment  # noqa: F401
+        return 'pydub', _enqueue_pydub
+
+    return None
+
+
+_PLAYBACK_BACKEND = _resolve_playback_backend()
+
+
+def _play_audio_locally(audio_data: bytes, output_format: str) -> None:
+    """Play audio data locally using the backend resolved at import."""
+    if _PLAYBACK_BACKEND is None:
+        logger.warning("No audio playback backend available. Install ffplay or pip install -e \".[playback]\" for sounddevice support.")
+        return
+
+    name, play_func = _PLAYBACK_BACKEND
+    try:
+        logger.debug(f"Playing audio locally via {name}")
+        play_func(audio_data, output_format)
     except Exception as e:
         logger.error(f"Error playing audio locally: {str(e)}")
 
+# End-of-stream marker for _aiter_blocking (None could be a valid item)
+_STREAM_DONE = object()
+
+
+async def _aiter_blocking(sync_iter, maxsize: int = 8) -> AsyncGenerator[bytes, None]:
+    """Iterate a blocking iterator from a worker thread.
+
+    The ElevenLabs SDK returns a synchronous generator whose HTTP reads
+    would otherwise block the event loop. A thread pumps items into a
+    bounded asyncio.Queue; awaiting queue.get() keeps the loop free and
+    yields cooperatively without explicit sleep(0) calls.
+
+    The consumer may stop early (e.g. speak() returns on a SIP stop
+    request, closing this generator); a cancellation flag unblocks the
+    pump thread and sync_iter is closed so the HTTP stream is released
+    instead of leaking an executor thread per interruption.
+    """
+    q: asyncio.Queue = asyncio.Queue(maxsize)
+    loop = asyncio.get_running_loop()
+    cancelled = threading.Event()
+
+    def pump():
+        try:
+            for item in sync_iter:
+                if cancelled.is_set():
+                    return
+                fut = asyncio.run_coroutine_threadsafe(q.put(item), loop)
+                while True:
+                    try:
+                        fut.result(timeout=0.25)
+                        break
+                    except concurrent.futures.TimeoutError:
+                        # Queue full and nobody consuming: bail out once
+                        # the consumer signals cancellation
+                        if cancelled.is_set():
+                            fut.cancel()
+                            return
+        finally:
+            # Release the HTTP stream held by the SDK generator
+            close = getattr(sync_iter, 'close', None)
+            if close is not None:
+                with suppress(Exception):
+                    close()
+            if not cancelled.is_set():
+                with suppress(Exception):
+                    asyncio.run_coroutine_threadsafe(q.put(_STREAM_DONE), loop).result(timeout=1)
+
+    pump_future = loop.run_in_executor(None, pump)
+
+    try:
+        while (item := await q.get()) is not _STREAM_DONE:
+            yield item
+
+        # Surface any exception raised on the worker thread
+        await pump_future
+    finally:
+        cancelled.set()
+        # Unblock a pump thread stuck on a full queue
+        while not q.empty():
+            q.get_nowait()
+        if not pump_future.done():
+            with suppress(Exception):
+                await pump_future
+
+
 class ElevenLabsStreamer:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv('ELEVENLABS_API_KEY')
         if not self.api_key:
             raise ValueError("ElevenLabs API key not found. Set ELEVENLABS_API_KEY environment variable.")
         
-        self.client = ElevenLabs(api_key=self.api_key)
-        self.local_playback_enabled = _get_local_playback_enabled()
-        
+        # Reuse one pooled keep-alive HTTP client across calls so
+        # back-to-back utterances don't pay TLS setup + TCP slow start
+        # per stream. elevenlabs already depends on httpx.
+        self._httpx_client = None
+        try:
+            import httpx
+            # Explicit timeout matching the SDK default (60 s) - a bare
+            # httpx.Client would otherwise default to 5 s and cut off
+            # long generations
+            self._httpx_client = httpx.Client(
+                timeout=httpx.Timeout(60.0),
+                limits=httpx.Limits(max_keepalive_connections=4)
+            )
+            self.client = ElevenLabs(api_key=self.api_key, httpx_client=self._httpx_client)
+        except (ImportError, TypeError):
+            # Older SDKs without the httpx_client hook
+            self._httpx_client = None
+            self.client = ElevenLabs(api_key=self.api_key)
+
+        # Resolve the SIP output binding once instead of re-querying the
+        # service registry on every call
+        self._sip_out = service_manager.functions.get('sip_audio_out_chunk', None)
+        self.local_playback_enabled = self._sip_out is None
+
         if self.local_playback_enabled:
-            logger.info("Local audio playback enabled (MR_TTS_PLAY_LOCAL=true)")
+            logger.info("Local audio playback enabled (no SIP audio output registered)")
+
+    def refresh_sip_binding(self):
+        """Re-resolve the SIP output service after services (un)register."""
+        self._sip_out = service_manager.functions.get('sip_audio_out_chunk', None)
+        self.local_playback_enabled = self._sip_out is None
     
     async def stream_text_to_speech(
         self,
@@ -196,16 +469,17 @@ class ElevenLabsStreamer:
         try:
             logger.info(f"Starting TTS stream for text: {text[:50]}...")
 
-            # functions is a dict
-            # check if 'sip_audio_out_chunk' is available in service_manager
-            if service_manager.functions.get('sip_audio_out_chunk'):
-                self.local_playback_enabled = False
-            else:
-                self.local_playback_enabled = True
-            
+            # Service load order isn't guaranteed, so re-resolve the SIP
+            # binding per call - it's a single dict lookup
+            self.refresh_sip_binding()
+
             # Always use the requested format for streaming (ulaw_8000 for SIP)
-            # Local playback will handle format conversion if needed
-            if self.local_playback_enabled:
+            # Local playback will handle format conversion if needed.
+            # sounddevice plays ulaw/pcm directly, so only switch to mp3
+            # for the backends that need a compressed container
+            if self.local_playback_enabled and not (
+                _PLAYBACK_BACKEND is not None and _PLAYBACK_BACKEND[0] == 'sounddevice'
+            ):
                 output_format = "mp3_22050_32"
             # Create the streaming request
             voice_settings = {"stability": stability,
@@ -219,34 +493,61 @@ class ElevenLabsStreamer:
                 voice_settings=voice_settings,
                 **kwargs
             )
-            local_audio_buffer = b"" if self.local_playback_enabled else None
-             
+            # Local playback: stream each chunk straight into a persistent
+            # ffplay process so audio starts on the first chunk instead of
+            # after the whole utterance. Fall back to buffering when ffplay
+            # is unavailable. (list append + one join is O(N) total;
+            # bytes += would copy the whole buffer on every chunk)
+            local_audio_buffer = None
+            ffplay_proc = None
+            loop = asyncio.get_event_loop()
+            if self.local_playback_enabled:
+                if shutil.which('ffplay'):
+                    ffplay_proc = await _get_ffplay_proc(output_format)
+                elif _PLAYBACK_BACKEND is not None:
+                    logger.debug("ffplay not available, buffering for fallback playback")
+                    local_audio_buffer = []
+                else:
+                    # No backend can play this anyway; don't waste memory
+                    # accumulating audio that _play_audio_locally would drop
+                    logger.debug("No playback backend available, skipping local audio buffering")
+
             chunk_count = 0
-            for chunk in audio_stream:
+            # Pump the SDK's blocking iterator on a worker thread so HTTP
+            # reads never stall the event loop; queue.get() yields for us
+            async for chunk in _aiter_blocking(audio_stream):
                 if isinstance(chunk, bytes):
                     chunk_count += 1
-                    logger.debug(f"Yielding audio chunk {chunk_count}, size: {len(chunk)} bytes")
-                    
-                    # Collect for local playback
-                    if self.local_playback_enabled:
-                        local_audio_buffer += chunk
-                    
+                    # Guard so the f-string isn't formatted per chunk when
+                    # DEBUG is off
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Yielding audio chunk {chunk_count}, size: {len(chunk)} bytes")
+
+                    # Play / collect for local playback; a dead ffplay
+                    # must not abort the TTS stream itself
+                    if ffplay_proc is not None:
+                        try:
+                            ffplay_proc.stdin.write(chunk)
+                            await ffplay_proc.stdin.drain()
+                        except (BrokenPipeError, ConnectionResetError, OSError) as e:
+                            logger.warning(f"Streaming playback failed, continuing without it: {str(e)}")
+                            _FFPLAY_PROCS.pop(output_format, None)
+                            ffplay_proc = None
+                    elif local_audio_buffer is not None:
+                        local_audio_buffer.append(chunk)
+
                     yield chunk
-                    
-                    # Allow other coroutines to run
-                    await asyncio.sleep(0)
-            
+
             logger.info(f"TTS streaming completed. Total chunks: {chunk_count}")
-            
-            # Play locally if enabled
-            if self.local_playback_enabled and local_audio_buffer:
+
+            # Fallback batch playback when streaming playback was unavailable
+            if local_audio_buffer:
                 logger.info("Playing audio locally...")
                 # Run in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
                 await loop.run_in_executor(
-                    None, 
-                    _play_audio_locally, 
-                    local_audio_buffer, 
+                    None,
+                    _play_audio_locally,
+                    b"".join(local_audio_buffer),
                     output_format
                 )
             
@@ -262,6 +563,10 @@ def get_streamer() -> ElevenLabsStreamer:
     global _streamer
     if _streamer is None:
         _streamer = ElevenLabsStreamer()
+    elif _streamer._sip_out is None:
+        # The prewarmed instance resolved its binding at plugin import,
+        # possibly before the SIP plugin registered its services
+        _streamer.refresh_sip_binding()
     return _streamer
 
 @service()
@@ -378,46 +683,77 @@ async def speak(
             await lock.acquire()
         
         chunk_count = 0
-        local_playback = _get_local_playback_enabled()
-        try:
-            agent_data = await service_manager.get_agent_data(context.agent_name)
-            persona = agent_data["persona"]
-            voiceid = persona.get("voice_id", DEFAULT_VOICE_ID)
-        except Exception as e:
-            logger.warning(f"Could not get agent persona voice_id, using default. Error: {str(e)}")
-            voiceid = voice_id or DEFAULT_VOICE_ID
+        streamer = get_streamer()
+        # Re-resolve per call: the SIP plugin may (un)register at any time
+        streamer.refresh_sip_binding()
+        local_playback = streamer.local_playback_enabled
+        sip_out = streamer._sip_out
+        voiceid = voice_id or DEFAULT_VOICE_ID
+        if context is not None and getattr(context, 'agent_name', None):
+            voiceid = await _resolve_voice(context.agent_name, voiceid)
 
-        total_sleep = 0
-        chunk_length = 0
-        async for chunk in stream_tts(text=text, voice_id=voiceid, context=context):
+        # Pace sends against an absolute schedule instead of sleeping a
+        # fudged per-chunk duration: per-iteration sleep overhead then
+        # accumulates as drift instead of compounding into lag. Keep
+        # ~20 ms of audio in flight ahead of real time.
+        loop = asyncio.get_event_loop()
+        send_start = None
+        sent_seconds = 0.0
+        frame_count = 0
+        # Resolve the byte rate for the format once, instead of assuming
+        # ulaw_8000 implicitly in the per-frame timing math
+        output_format = DEFAULT_OUTPUT_FORMAT
+        bytes_per_sec = _BYTES_PER_SEC.get(output_format, 8000)
+        # Re-frame variable-sized SDK chunks into fixed 20 ms RTP frames
+        # so the SIP layer doesn't have to re-buffer and re-split them
+        pending = bytearray()
+        async for chunk in stream_tts(text=text, voice_id=voiceid, output_format=output_format, context=context):
             chunk_count += 1
 
             try:
                 if not local_playback:
-                    should_continue = await service_manager.sip_audio_out_chunk(chunk, context=context)
-                    chunk_length = len(chunk)
-                    chunk_duration = len(chunk) / 8000.0  # seconds of audio
-                    to_wait = chunk_duration * 0.92
-                    await asyncio.sleep(to_wait)
-                    total_sleep += to_wait
-                    logger.debug(f"SPEAK_DEBUG: Sent {chunk_count} audio chunks, chunk size: {chunk_length} bytes, total sleep time: {total_sleep:.2f} seconds, log_id: {context.log_id}")
- 
-                    if not should_continue:
-                        logger.debug("SPEAK_DEBUG: SIP output requested to stop streaming.")
-                        await asyncio.sleep(0.01)
-                        if chunk_count < 2:
-                            return "SYSTEM: WARNING - Command interrupted!\n\n"
-                        return None
+                    pending.extend(chunk)
+                    while len(pending) >= RTP_FRAME_BYTES:
+                        frame = bytes(pending[:RTP_FRAME_BYTES])
+                        del pending[:RTP_FRAME_BYTES]
+                        should_continue = await sip_out(frame, context=context)
+                        frame_count += 1
+                        if send_start is None:
+                            send_start = loop.time()
+                        sent_seconds += RTP_FRAME_BYTES / bytes_per_sec  # seconds of audio
+                        target = send_start + sent_seconds - 0.020
+                        now = loop.time()
+                        if target > now:
+                            await asyncio.sleep(target - now)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"SPEAK_DEBUG: Sent {frame_count} audio frames, audio sent: {sent_seconds:.2f} seconds, log_id: {context.log_id}")
+
+                        if not should_continue:
+                            logger.debug("SPEAK_DEBUG: SIP output requested to stop streaming.")
+                            # Drain only the audio actually still in flight
+                            # rather than a fixed grace period
+                            remaining = send_start + sent_seconds - loop.time()
+                            if remaining > 0:
+                                await asyncio.sleep(remaining)
+                            if chunk_count < 2:
+                                return "SYSTEM: WARNING - Command interrupted!\n\n"
+                            return None
             except Exception as e:
                 should_continue = True
                 logger.warning(f"Error sending audio chunk to SIP output: {str(e)}. Is SIP enabled?")
-                asyncio.sleep(1)
-                return "Error sending audio chunk to SIP output: {str(e)}"
+                return f"Error sending audio chunk to SIP output: {str(e)}"
 
         if not local_playback:
-            # show chunk len and total sleep time
+            # Flush the sub-frame tail left over from re-framing
+            if pending:
+                try:
+                    await sip_out(bytes(pending), context=context)
+                    sent_seconds += len(pending) / bytes_per_sec
+                    frame_count += 1
+                except Exception as e:
+                    logger.warning(f"Error flushing final audio frame to SIP output: {str(e)}")
 
-            logger.info(f"SPEAK_DEBUG: Sent {chunk_count} audio chunks, chunk size: {chunk_length} bytes, total sleep time: {total_sleep:.2f} seconds")
+            logger.info(f"SPEAK_DEBUG: Sent {frame_count} audio frames ({chunk_count} chunks), audio sent: {sent_seconds:.2f} seconds")
             await asyncio.sleep(0.01)
          
         logger.info(f"Speech streaming completed: {len(text)} characters, {chunk_count} audio chunks{' (also played locally)' if local_playback else ''}")
@@ -433,3 +769,12 @@ async def speak(
             lock = _active_speak_locks[log_id]
             if lock.locked():
                 lock.release()
+
+
+# Prewarm the client at plugin load rather than on the first utterance,
+# so the first live phone call doesn't pay client construction + DNS +
+# TLS setup. Falls back to lazy construction when no API key is set yet.
+try:
+    _streamer = ElevenLabsStreamer()
+except ValueError:
+    pass